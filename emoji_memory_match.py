@@ -11,57 +11,59 @@ import random
 import time
 import sys
 import os
-from typing import List, Tuple, Optional, Dict
-from enum import Enum
+import struct
+from typing import List, Tuple, Optional, Dict, Set
 
 
-class CardState(Enum):
-    """Enum representing the different states a card can be in."""
-    HIDDEN = "hidden"
-    REVEALED = "revealed"
-    MATCHED = "matched"
-    FLIPPING = "flipping"
+# The different states a card can be in. Plain ints keep the state checks in the
+# game loop cheap and let per-state tables be indexed directly.
+HIDDEN, REVEALED, MATCHED, FLIPPING = 0, 1, 2, 3
 
 
 class Card:
     """Represents a single card in the memory game."""
     
-    def __init__(self, image_id: str, image_surface: pygame.Surface, row: int, col: int):
+    # Fixed attribute layout: smaller objects and faster attribute access in the game loop
+    __slots__ = ("image_id", "row", "col", "rect", "state",
+                 "flip_animation_progress", "match_animation_progress")
+    
+    def __init__(self, image_id: str, row: int, col: int, rect: pygame.Rect):
         self.image_id = image_id
-        self.image_surface = image_surface
         self.row = row
         self.col = col
-        self.state = CardState.HIDDEN
+        self.rect = rect
+        self.state = HIDDEN
         self.flip_animation_progress = 0.0
         self.match_animation_progress = 0.0
     
     def start_flip_animation(self):
         """Start the flip animation for this card."""
-        self.state = CardState.FLIPPING
+        self.state = FLIPPING
         self.flip_animation_progress = 0.0
     
-    def update_flip_animation(self, dt: float) -> bool:
-        """Update flip animation. Returns True when animation is complete."""
-        if self.state == CardState.FLIPPING:
-            self.flip_animation_progress += dt * 8.0  # Animation speed
-            if self.flip_animation_progress >= 1.0:
-                self.flip_animation_progress = 1.0
-                self.state = CardState.REVEALED
-                return True
-        return False
-    
     def start_match_animation(self):
         """Start the match animation for this card."""
         self.match_animation_progress = 0.0
     
-    def update_match_animation(self, dt: float) -> bool:
-        """Update match animation. Returns True when animation is complete."""
-        if self.state == CardState.MATCHED:
+    def update_animation(self, dt: float) -> bool:
+        """Advance the running flip or match animation. Returns True once the card is idle."""
+        if self.state == FLIPPING:
+            self.flip_animation_progress += dt * 8.0  # Animation speed
+            if self.flip_animation_progress >= 1.0:
+                self.flip_animation_progress = 1.0
+                self.state = REVEALED
+                return True
+            return False
+        
+        if self.state == MATCHED:
             self.match_animation_progress += dt * 4.0  # Animation speed
             if self.match_animation_progress >= 1.0:
                 self.match_animation_progress = 1.0
                 return True
-        return False
+            return False
+        
+        # Hidden or revealed cards have nothing left to animate
+        return True
 
 
 class MemoryGame:
@@ -71,6 +73,14 @@ class MemoryGame:
     GRID_SIZE = 4
     CARD_SIZE = 100
     CARD_MARGIN = 10
+    FLIP_FRAME_STEPS = 8  # Number of pre-scaled image sizes used by the flip animation
+    FLIP_FRAME_MIN_SCALE = 0.5  # The image only shows in the second half of a flip
+    
+    # Image files
+    IMAGE_DIR = "/home/ell/q/images"
+    # Define the image files we want to use (now we have 8 unique images)
+    IMAGE_FILES = ["1.jpg", "2.png", "3.png", "6.jpg", "9.jpg", "11.png", "12.jpg", "13.jpg"]
+    ATLAS_FILE = "atlas.png"  # All card faces in one row, built with --build-atlas
     WINDOW_WIDTH = GRID_SIZE * (CARD_SIZE + CARD_MARGIN) - CARD_MARGIN + 200
     WINDOW_HEIGHT = GRID_SIZE * (CARD_SIZE + CARD_MARGIN) - CARD_MARGIN + 150
     
@@ -82,6 +92,24 @@ class MemoryGame:
     COLOR_TEXT = (255, 255, 255)
     COLOR_WIN_TEXT = (255, 215, 0)
     
+    # Events meaning the window contents were lost. WINDOWEXPOSED is missing from
+    # pygame 2.0.0; VIDEOEXPOSE alone already covers it on SDL2.
+    EXPOSE_EVENTS = tuple(event_type for event_type in
+                          (pygame.VIDEOEXPOSE, getattr(pygame, "WINDOWEXPOSED", None))
+                          if event_type is not None)
+    
+    # The only event types handle_event reacts to; everything else is never queued
+    HANDLED_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, *EXPOSE_EVENTS]
+    
+    # Card fill color, border color and border width, indexed by state.
+    # Matched cards get a thicker border to show they're blocked.
+    CARD_STYLES = (
+        (COLOR_CARD_HIDDEN, (0, 0, 0), 2),     # HIDDEN
+        (COLOR_CARD_REVEALED, (0, 0, 0), 2),   # REVEALED
+        (COLOR_CARD_MATCHED, (0, 100, 0), 4),  # MATCHED
+        (COLOR_CARD_REVEALED, (0, 0, 0), 2),   # FLIPPING
+    )
+    
     def __init__(self):
         """Initialize the game."""
         pygame.init()
@@ -91,57 +119,219 @@ class MemoryGame:
         self.font = pygame.font.Font(None, 36)
         self.big_font = pygame.font.Font(None, 48)
         
-        # Load images
-        self.images = self.load_images()
+        # Keep mouse motion and other unused events out of the queue entirely
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(self.HANDLED_EVENTS)
+        
+        # Find images - they are only loaded the first time a card shows them
+        self._image_paths = self.load_images()
+        self._image_cache: Dict[str, pygame.Surface] = {}
+        self._atlas_loaded = False  # The atlas is decoded at most once, even if that fails
+        # Keyed by image id, not by card: both cards of a pair share one set of
+        # flip frames, so memory stays at 8 images x FLIP_FRAME_STEPS surfaces
+        self.scaled_ladders: Dict[str, List[pygame.Surface]] = {}
+        
+        # Pre-render card templates so draw_card only has to blit
+        self.build_card_surfaces()
+        
+        # Card positions never change, so compute their rectangles once
+        self._card_rects = [[pygame.Rect(col * (self.CARD_SIZE + self.CARD_MARGIN),
+                                         row * (self.CARD_SIZE + self.CARD_MARGIN) + 100,  # Offset for UI
+                                         self.CARD_SIZE, self.CARD_SIZE)
+                             for col in range(self.GRID_SIZE)]
+                            for row in range(self.GRID_SIZE)]
+        
+        # Screen strips holding the UI text above and below the card grid
+        grid_bottom = self.GRID_SIZE * (self.CARD_SIZE + self.CARD_MARGIN) - self.CARD_MARGIN + 100
+        self._ui_rects = [pygame.Rect(0, 0, self.WINDOW_WIDTH, 100),
+                          pygame.Rect(0, grid_bottom, self.WINDOW_WIDTH, self.WINDOW_HEIGHT - grid_bottom)]
         
         # Game state
         self.cards: List[List[Card]] = []
+        self._flat_cards: List[Card] = []  # The same cards in reading order
         self.revealed_cards: List[Card] = []
         self.moves = 0
+        self._matched_pairs = 0
         self.start_time = None
         self.game_won = False
         self.mismatch_timer = 0.0
         self.showing_mismatch = False
+        self._animating: Set[Card] = set()  # Cards with an animation in progress
+        self._dirty_cards: Set[Card] = set()  # Cards to redraw on the next frame
+        self._ui_dirty = False
+        self._needs_redraw = True  # Redraw the whole window on the next frame
+        self.win_time: Optional[float] = None
+        
+        # Cached text surfaces, re-rendered only when their text changes
+        self._moves_surf: Optional[pygame.Surface] = None
+        self._moves_cached_value = -1
+        self._timer_surf: Optional[pygame.Surface] = None
+        self._timer_cached_deciseconds = -1
+        self._win_surfaces: Optional[List[Tuple[pygame.Surface, pygame.Rect]]] = None
         
         self.setup_game()
     
-    def load_images(self) -> Dict[str, pygame.Surface]:
-        """Load and scale images from the images directory."""
-        images = {}
-        image_dir = "/home/ell/q/images"
+    def load_images(self) -> Dict[str, Optional[str]]:
+        """Find the image files to use. Decoding is deferred until _get_image is called."""
+        image_paths: Dict[str, Optional[str]] = {}
+        
+        # Prefer the sprite sheet: one file to open and decode instead of eight
+        atlas_path = os.path.join(self.IMAGE_DIR, self.ATLAS_FILE)
+        tile_count = self.count_atlas_tiles(atlas_path) if os.path.exists(atlas_path) else 0
+        if tile_count > 0:
+            for i in range(tile_count):
+                image_paths[f"slot_{i}"] = atlas_path
+        else:
+            for filename in self.IMAGE_FILES:
+                filepath = os.path.join(self.IMAGE_DIR, filename)
+                if os.path.exists(filepath):
+                    image_paths[filename] = filepath
         
-        # Define the image files we want to use (now we have 8 unique images)
-        image_files = ["1.jpg", "2.png", "3.png", "6.jpg", "9.jpg", "11.png", "12.jpg", "13.jpg"]
+        if len(image_paths) < 8:
+            print(f"Warning: Only {len(image_paths)} images found, need 8 for optimal gameplay.")
+            # Use fallback colored rectangles if needed
+            for i in range(len(image_paths), 8):
+                image_paths[f"fallback_{i}"] = None
         
-        for filename in image_files:
-            filepath = os.path.join(image_dir, filename)
-            if os.path.exists(filepath):
+        return image_paths
+    
+    def count_atlas_tiles(self, atlas_path: str) -> int:
+        """Return how many card faces the atlas holds, read from its PNG header without decoding it."""
+        try:
+            with open(atlas_path, "rb") as atlas_file:
+                header = atlas_file.read(24)
+        except OSError as e:
+            print(f"Ignoring image atlas {atlas_path}: {e}")
+            return 0
+        if len(header) < 24 or header[:8] != b"\x89PNG\r\n\x1a\n":
+            print(f"Ignoring image atlas {atlas_path}: not a PNG file")
+            return 0
+        
+        # Only a single row of whole tiles at the current card size can be split correctly
+        width, height = struct.unpack(">II", header[16:24])
+        tile_size = self.CARD_SIZE - 10
+        if height != tile_size or width == 0 or width % tile_size != 0:
+            print(f"Ignoring image atlas {atlas_path}: {width}x{height} is not a row of "
+                  f"{tile_size}x{tile_size} tiles, rebuild it with --build-atlas")
+            return 0
+        return min(width // tile_size, 8)
+    
+    def make_fallback_image(self, index: int) -> pygame.Surface:
+        """Create a plain colored image used when an image file is missing or unreadable."""
+        colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 0), 
+                 (255, 0, 255), (0, 255, 255), (128, 128, 128), (255, 128, 0)]
+        surface = pygame.Surface((self.CARD_SIZE - 10, self.CARD_SIZE - 10)).convert()
+        surface.fill(colors[index % len(colors)])
+        return surface
+    
+    def _get_image(self, key: str) -> pygame.Surface:
+        """Return the scaled image for key, loading it from disk on first use."""
+        image = self._image_cache.get(key)
+        if image is not None:
+            return image
+        
+        filepath = self._image_paths[key]
+        if filepath is not None and filepath.endswith(self.ATLAS_FILE):
+            if not self._atlas_loaded:
+                self._atlas_loaded = True
                 try:
-                    # Load image
-                    image = pygame.image.load(filepath)
-                    # Scale to fit card size with some padding
-                    scaled_image = pygame.transform.scale(image, (self.CARD_SIZE - 10, self.CARD_SIZE - 10))
-                    images[filename] = scaled_image
-                    print(f"Loaded image: {filename}")
+                    self.load_atlas(filepath)
                 except pygame.error as e:
-                    print(f"Could not load image {filename}: {e}")
+                    print(f"Could not load image atlas {filepath}: {e}")
+            # load_atlas caches every slot together with its flip frames
+            image = self._image_cache.get(key)
+            if image is not None:
+                return image
+        elif filepath is not None:
+            try:
+                # Load image
+                image = pygame.image.load(filepath)
+                # Scale to fit card size with some padding
+                image = pygame.transform.scale(image, (self.CARD_SIZE - 10, self.CARD_SIZE - 10))
+                # Convert to the display's pixel format so per-frame blits are fast
+                if filepath.lower().endswith('.png'):
+                    image = image.convert_alpha()
+                else:
+                    image = image.convert()
+                print(f"Loaded image: {key}")
+            except pygame.error as e:
+                print(f"Could not load image {key}: {e}")
+                image = None
         
-        if len(images) < 8:
-            print(f"Warning: Only {len(images)} images loaded, need 8 for optimal gameplay.")
-            # Create fallback colored rectangles if needed
-            colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 0), 
-                     (255, 0, 255), (0, 255, 255), (128, 128, 128), (255, 128, 0)]
-            for i in range(len(images), 8):
-                surface = pygame.Surface((self.CARD_SIZE - 10, self.CARD_SIZE - 10))
-                surface.fill(colors[i])
-                images[f"fallback_{i}"] = surface
+        if image is None:
+            image = self.make_fallback_image(list(self._image_paths).index(key))
         
-        return images
+        self._image_cache[key] = image
+        self.add_flip_frames(key, image)
+        return image
+    
+    def load_atlas(self, filepath: str):
+        """Split the sprite sheet into the card images listed by load_images."""
+        atlas = pygame.image.load(filepath).convert_alpha()
+        tile_size = self.CARD_SIZE - 10
+        for i, key in enumerate(key for key in self._image_paths if key.startswith("slot_")):
+            image = atlas.subsurface(pygame.Rect(i * tile_size, 0, tile_size, tile_size))
+            # Faces with transparency stay subsurfaces sharing the atlas pixels; fully
+            # opaque faces are converted without per-pixel alpha so they blit faster
+            if pygame.mask.from_surface(image, 254).count() == tile_size * tile_size:
+                image = image.convert()
+            self._image_cache[key] = image
+            self.add_flip_frames(key, image)
+        print(f"Loaded image atlas: {filepath}")
+    
+    def add_flip_frames(self, key: str, image: pygame.Surface):
+        """Build the flip frames for an image exactly once, shared by both cards of its pair."""
+        # Holds because each key is cached before its frames are built and the atlas loads once
+        assert key not in self.scaled_ladders, f"flip frames for {key} built twice"
+        self.scaled_ladders[key] = self.build_flip_frames(image)
+    
+    def _get_flip_frames(self, key: str) -> List[pygame.Surface]:
+        """Return the pre-scaled flip animation frames for key, loading the image if needed."""
+        if key not in self.scaled_ladders:
+            self._get_image(key)
+        return self.scaled_ladders[key]
+    
+    def build_flip_frames(self, image: pygame.Surface) -> List[pygame.Surface]:
+        """Pre-scale an image to the discrete sizes shown during the flip animation."""
+        width, height = image.get_size()
+        frames = []
+        scale_range = 1.0 - self.FLIP_FRAME_MIN_SCALE
+        for step in range(self.FLIP_FRAME_STEPS):
+            scale = self.FLIP_FRAME_MIN_SCALE + scale_range * step / (self.FLIP_FRAME_STEPS - 1)
+            new_size = (max(1, int(width * scale)), max(1, int(height * scale)))
+            frames.append(pygame.transform.scale(image, new_size))
+        frames[-1] = image  # Full size is the original surface itself
+        return frames
+    
+    def build_card_surfaces(self):
+        """Pre-render the card backgrounds, borders and overlays used by draw_card."""
+        size = (self.CARD_SIZE, self.CARD_SIZE)
+        card_rect = pygame.Rect((0, 0), size)
+        
+        # One background per state, indexed by state in draw_card
+        self._card_surfaces: List[pygame.Surface] = []
+        for color, border_color, border_width in self.CARD_STYLES:
+            surface = pygame.Surface(size).convert()
+            surface.fill(color)
+            pygame.draw.rect(surface, border_color, card_rect, border_width)
+            self._card_surfaces.append(surface)
+        
+        # Used while the match fade is running: the fill fades, the border stays opaque
+        color, border_color, border_width = self.CARD_STYLES[MATCHED]
+        self._surf_match_fade = pygame.Surface(size).convert()
+        self._surf_match_fade.fill(color)
+        self._surf_matched_border = pygame.Surface(size).convert_alpha()
+        self._surf_matched_border.fill((0, 0, 0, 0))
+        pygame.draw.rect(self._surf_matched_border, border_color, card_rect, border_width)
+        
+        # Very subtle white overlay for matched cards
+        self._surf_match_overlay = pygame.Surface(size).convert_alpha()
+        self._surf_match_overlay.fill((255, 255, 255, 30))
     
     def setup_game(self):
         """Set up a new game by creating and shuffling cards."""
         # Get all available image keys
-        image_keys = list(self.images.keys())
+        image_keys = list(self._image_paths.keys())
         
         # We now have exactly 8 unique images, so no repetition needed!
         # Each image will appear exactly twice (8 images × 2 = 16 cards for 4×4 grid)
@@ -158,53 +348,60 @@ class MemoryGame:
         image_pairs = selected_images * 2  # Each image appears twice
         random.shuffle(image_pairs)
         
-        # Create card grid
-        self.cards = []
-        image_index = 0
-        
-        for row in range(self.GRID_SIZE):
-            card_row = []
-            for col in range(self.GRID_SIZE):
-                image_key = image_pairs[image_index]
-                image_surface = self.images[image_key]
-                
-                # Use the image key directly as the ID (no need for unique suffixes)
-                card = Card(image_key, image_surface, row, col)
-                card_row.append(card)
-                image_index += 1
-            self.cards.append(card_row)
+        # Deal the shuffled pairs in reading order, then slice the flat list into rows.
+        # Use the image key directly as the ID (no need for unique suffixes)
+        size = self.GRID_SIZE
+        self._flat_cards = [Card(image_key, i // size, i % size, self.get_card_rect(i // size, i % size))
+                            for i, image_key in enumerate(image_pairs)]
+        self.cards = [self._flat_cards[row * size:(row + 1) * size] for row in range(size)]
         
         # Reset game state
         self.revealed_cards = []
         self.moves = 0
+        self._matched_pairs = 0
         self.start_time = None
         self.game_won = False
         self.mismatch_timer = 0.0
         self.showing_mismatch = False
+        self._animating = set()
+        self._dirty_cards = set()
+        self._ui_dirty = False
+        self._needs_redraw = True
+        self.win_time = None
+        self._win_surfaces = None
+        self._timer_cached_deciseconds = -1
     
     def get_card_rect(self, row: int, col: int) -> pygame.Rect:
         """Get the rectangle for a card at the given position."""
-        x = col * (self.CARD_SIZE + self.CARD_MARGIN)
-        y = row * (self.CARD_SIZE + self.CARD_MARGIN) + 100  # Offset for UI
-        return pygame.Rect(x, y, self.CARD_SIZE, self.CARD_SIZE)
+        return self._card_rects[row][col]
     
     def handle_card_click(self, pos: Tuple[int, int]):
         """Handle clicking on a card."""
         if self.game_won or self.showing_mismatch:
             return
         
-        # Find which card was clicked
-        for row in range(self.GRID_SIZE):
-            for col in range(self.GRID_SIZE):
-                card_rect = self.get_card_rect(row, col)
-                if card_rect.collidepoint(pos):
-                    card = self.cards[row][col]
-                    
-                    # Only allow clicking on hidden cards (not matched or already revealed)
-                    if card.state == CardState.HIDDEN:
-                        self.reveal_card(card)
-                    # Matched cards are blocked and cannot be clicked
-                    return
+        # Find which card was clicked - cards sit on a uniform grid below the UI
+        x, y = pos
+        y -= 100  # Offset for UI
+        if x < 0 or y < 0:
+            return
+        
+        stride = self.CARD_SIZE + self.CARD_MARGIN
+        col, col_offset = divmod(x, stride)
+        row, row_offset = divmod(y, stride)
+        
+        # Ignore clicks in the margins between cards or outside the grid
+        if col_offset >= self.CARD_SIZE or row_offset >= self.CARD_SIZE:
+            return
+        if row >= self.GRID_SIZE or col >= self.GRID_SIZE:
+            return
+        
+        card = self.cards[row][col]
+        
+        # Only allow clicking on hidden cards (not matched or already revealed)
+        # Matched cards are blocked and cannot be clicked
+        if card.state == HIDDEN:
+            self.reveal_card(card)
     
     def reveal_card(self, card: Card):
         """Reveal a card and handle game logic."""
@@ -214,7 +411,10 @@ class MemoryGame:
         
         # Start flip animation
         card.start_flip_animation()
+        self.track_animation(card)
         self.revealed_cards.append(card)
+        self._dirty_cards.add(card)
+        self._ui_dirty = True
         
         # Check if we have two revealed cards
         if len(self.revealed_cards) == 2:
@@ -224,35 +424,52 @@ class MemoryGame:
             card1, card2 = self.revealed_cards
             if card1.image_id == card2.image_id:
                 # Match found
-                card1.state = CardState.MATCHED
-                card2.state = CardState.MATCHED
+                card1.state = MATCHED
+                card2.state = MATCHED
                 card1.start_match_animation()
                 card2.start_match_animation()
+                # card1 usually finished its flip and left the animating set already
+                self.track_animation(card1)
+                self.track_animation(card2)
+                self._dirty_cards.update((card1, card2))
                 self.revealed_cards = []
                 
                 # Check for win condition
+                self._matched_pairs += 1
                 self.check_win()
             else:
                 # No match - will hide cards after delay
                 self.showing_mismatch = True
                 self.mismatch_timer = 1.0  # 1 second delay
     
+    def track_animation(self, card: Card):
+        """Have update() advance a card that just started a flip or match animation."""
+        self._animating.add(card)
+    
     def check_win(self):
         """Check if all cards have been matched."""
-        for row in self.cards:
-            for card in row:
-                if card.state != CardState.MATCHED:
-                    return
-        
-        self.game_won = True
+        if self._matched_pairs == (self.GRID_SIZE * self.GRID_SIZE) // 2:
+            self.game_won = True
+            self.win_time = time.time()
+    
+    def elapsed_deciseconds(self) -> int:
+        """Return the game time in tenths of a second, rounded, frozen once the game is won."""
+        end_time = self.win_time if self.win_time is not None else time.time()
+        return round((end_time - self.start_time) * 10)
     
     def update(self, dt: float):
         """Update game state."""
-        # Update card animations
-        for row in self.cards:
-            for card in row:
-                card.update_flip_animation(dt)
-                card.update_match_animation(dt)
+        # Update card animations - only cards that are actually animating
+        if self._animating:
+            self._dirty_cards.update(self._animating)
+            for card in list(self._animating):
+                if card.update_animation(dt):
+                    self._animating.discard(card)
+        
+        # The timer display changes every tenth of a second while a game is in progress
+        if self.start_time is not None and not self.game_won:
+            if self.elapsed_deciseconds() != self._timer_cached_deciseconds:
+                self._ui_dirty = True
         
         # Handle mismatch timer
         if self.showing_mismatch:
@@ -260,44 +477,32 @@ class MemoryGame:
             if self.mismatch_timer <= 0:
                 # Hide the mismatched cards
                 for card in self.revealed_cards:
-                    card.state = CardState.HIDDEN
+                    card.state = HIDDEN
+                self._dirty_cards.update(self.revealed_cards)
                 self.revealed_cards = []
                 self.showing_mismatch = False
     
     def draw_card(self, card: Card):
         """Draw a single card with appropriate state and animations."""
-        rect = self.get_card_rect(card.row, card.col)
-        
-        # Determine card color based on state
-        if card.state == CardState.HIDDEN:
-            color = self.COLOR_CARD_HIDDEN
-        elif card.state == CardState.MATCHED:
-            color = self.COLOR_CARD_MATCHED
-        else:
-            color = self.COLOR_CARD_REVEALED
+        rect = card.rect
         
-        # Apply match animation (fade effect)
-        if card.state == CardState.MATCHED and card.match_animation_progress < 1.0:
+        # Draw card background and border from the pre-rendered templates
+        if card.state == MATCHED and card.match_animation_progress < 1.0:
+            # Apply match animation (fade effect)
             alpha = int(255 * (1.0 - card.match_animation_progress * 0.3))
-            temp_surface = pygame.Surface((self.CARD_SIZE, self.CARD_SIZE))
-            temp_surface.fill(color)
-            temp_surface.set_alpha(alpha)
-            self.screen.blit(temp_surface, rect)
+            self._surf_match_fade.set_alpha(alpha)
+            self.screen.blit(self._surf_match_fade, rect)
+            self.screen.blit(self._surf_matched_border, rect)
         else:
-            pygame.draw.rect(self.screen, color, rect)
-        
-        # Draw border - thicker border for matched cards to show they're blocked
-        border_width = 4 if card.state == CardState.MATCHED else 2
-        border_color = (0, 100, 0) if card.state == CardState.MATCHED else (0, 0, 0)
-        pygame.draw.rect(self.screen, border_color, rect, border_width)
+            self.screen.blit(self._card_surfaces[card.state], rect)
         
         # Draw image if card is revealed or matched
-        if card.state in [CardState.REVEALED, CardState.MATCHED] or \
-           (card.state == CardState.FLIPPING and card.flip_animation_progress > 0.5):
+        if card.state in (REVEALED, MATCHED) or \
+           (card.state == FLIPPING and card.flip_animation_progress > 0.5):
             
             # Apply flip animation scaling
             scale = 1.0
-            if card.state == CardState.FLIPPING:
+            if card.state == FLIPPING:
                 # Scale effect during flip
                 progress = card.flip_animation_progress
                 if progress < 0.5:
@@ -305,15 +510,14 @@ class MemoryGame:
                 else:
                     scale = progress
             
-            # Get image surface
-            image_surface = card.image_surface
-            
-            # Apply scaling
+            # Pick the pre-scaled frame nearest to the current scale
             if scale != 1.0:
-                current_size = image_surface.get_size()
-                new_size = (int(current_size[0] * scale), int(current_size[1] * scale))
-                if new_size[0] > 0 and new_size[1] > 0:
-                    image_surface = pygame.transform.scale(image_surface, new_size)
+                flip_frames = self._get_flip_frames(card.image_id)
+                step = round((scale - self.FLIP_FRAME_MIN_SCALE) / (1.0 - self.FLIP_FRAME_MIN_SCALE)
+                             * (self.FLIP_FRAME_STEPS - 1))
+                image_surface = flip_frames[step]
+            else:
+                image_surface = self._get_image(card.image_id)
             
             # Center image on card
             image_rect = image_surface.get_rect()
@@ -321,76 +525,114 @@ class MemoryGame:
             self.screen.blit(image_surface, image_rect)
             
             # Add a subtle overlay for matched cards to show they're blocked
-            if card.state == CardState.MATCHED:
-                overlay = pygame.Surface((self.CARD_SIZE, self.CARD_SIZE))
-                overlay.fill((255, 255, 255))
-                overlay.set_alpha(30)  # Very subtle white overlay
-                self.screen.blit(overlay, rect)
+            if card.state == MATCHED:
+                self.screen.blit(self._surf_match_overlay, rect)
     
     def draw_ui(self):
         """Draw the user interface elements."""
-        # Draw moves counter
-        moves_text = self.font.render(f"Moves: {self.moves}", True, self.COLOR_TEXT)
-        self.screen.blit(moves_text, (10, 10))
+        # Draw moves counter - text is only re-rendered when the value changes
+        if self.moves != self._moves_cached_value:
+            self._moves_surf = self.font.render(f"Moves: {self.moves}", True, self.COLOR_TEXT)
+            self._moves_cached_value = self.moves
+        self.screen.blit(self._moves_surf, (10, 10))
         
         # Draw timer
         if self.start_time:
-            elapsed = time.time() - self.start_time
-            if self.game_won and hasattr(self, 'win_time'):
-                elapsed = self.win_time - self.start_time
-            timer_text = self.font.render(f"Time: {elapsed:.1f}s", True, self.COLOR_TEXT)
-            self.screen.blit(timer_text, (10, 50))
+            # The timer shows tenths of a second, so only format and render when those change
+            deciseconds = self.elapsed_deciseconds()
+            if deciseconds != self._timer_cached_deciseconds:
+                self._timer_surf = self.font.render(f"Time: {deciseconds // 10}.{deciseconds % 10}s",
+                                                    True, self.COLOR_TEXT)
+                self._timer_cached_deciseconds = deciseconds
+            self.screen.blit(self._timer_surf, (10, 50))
         
         # Draw win message
         if self.game_won:
-            if not hasattr(self, 'win_time'):
-                self.win_time = time.time()
-            
-            win_text = self.big_font.render("Congratulations!", True, self.COLOR_WIN_TEXT)
-            win_rect = win_text.get_rect(center=(self.WINDOW_WIDTH // 2, 30))
-            self.screen.blit(win_text, win_rect)
-            
-            final_time = self.win_time - self.start_time
-            stats_text = self.font.render(f"Completed in {self.moves} moves and {final_time:.1f} seconds!", 
-                                        True, self.COLOR_WIN_TEXT)
-            stats_rect = stats_text.get_rect(center=(self.WINDOW_WIDTH // 2, 70))
-            self.screen.blit(stats_text, stats_rect)
+            # The win screen never changes, so render it once per game
+            if self._win_surfaces is None:
+                win_text = self.big_font.render("Congratulations!", True, self.COLOR_WIN_TEXT)
+                win_rect = win_text.get_rect(center=(self.WINDOW_WIDTH // 2, 30))
+                
+                # Same rounding as the timer, so both show the same final time
+                final_time = self.elapsed_deciseconds()
+                stats_text = self.font.render(f"Completed in {self.moves} moves and "
+                                            f"{final_time // 10}.{final_time % 10} seconds!", 
+                                            True, self.COLOR_WIN_TEXT)
+                stats_rect = stats_text.get_rect(center=(self.WINDOW_WIDTH // 2, 70))
+                
+                restart_text = self.font.render("Press SPACE to play again or ESC to quit", 
+                                              True, self.COLOR_TEXT)
+                restart_rect = restart_text.get_rect(center=(self.WINDOW_WIDTH // 2, 
+                                                           self.WINDOW_HEIGHT - 30))
+                
+                self._win_surfaces = [(win_text, win_rect), (stats_text, stats_rect),
+                                      (restart_text, restart_rect)]
             
-            restart_text = self.font.render("Press SPACE to play again or ESC to quit", 
-                                          True, self.COLOR_TEXT)
-            restart_rect = restart_text.get_rect(center=(self.WINDOW_WIDTH // 2, 
-                                                       self.WINDOW_HEIGHT - 30))
-            self.screen.blit(restart_text, restart_rect)
+            for text_surface, text_rect in self._win_surfaces:
+                self.screen.blit(text_surface, text_rect)
     
     def draw(self):
-        """Draw the entire game."""
-        self.screen.fill(self.COLOR_BACKGROUND)
-        
-        # Draw all cards
-        for row in self.cards:
-            for card in row:
+        """Draw the parts of the game that changed since the last frame."""
+        if self._needs_redraw:
+            self.screen.fill(self.COLOR_BACKGROUND)
+            
+            # Draw all cards
+            for card in self._flat_cards:
                 self.draw_card(card)
+            
+            # Draw UI
+            self.draw_ui()
+            
+            pygame.display.flip()
         
-        # Draw UI
-        self.draw_ui()
+        elif self._dirty_cards or self._ui_dirty:
+            dirty_rects = []
+            
+            # Redraw changed cards over a cleared background
+            for card in self._dirty_cards:
+                self.screen.fill(self.COLOR_BACKGROUND, card.rect)
+                self.draw_card(card)
+                dirty_rects.append(card.rect)
+            
+            # Text is anti-aliased, so clear both UI strips before drawing it again
+            if self._ui_dirty:
+                for rect in self._ui_rects:
+                    self.screen.fill(self.COLOR_BACKGROUND, rect)
+                    dirty_rects.append(rect)
+                self.draw_ui()
+            
+            pygame.display.update(dirty_rects)
         
-        pygame.display.flip()
+        self._needs_redraw = False
+        self._dirty_cards.clear()
+        self._ui_dirty = False
     
     def handle_events(self):
-        """Handle pygame events."""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        """Handle all pending pygame events."""
+        for event in pygame.event.get(self.HANDLED_EVENTS):
+            if not self.handle_event(event):
                 return False
-            
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    return False
-                elif event.key == pygame.K_SPACE and self.game_won:
-                    self.setup_game()
-            
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1:  # Left click
-                    self.handle_card_click(event.pos)
+        
+        return True
+    
+    def handle_event(self, event: pygame.event.Event) -> bool:
+        """Handle a single pygame event. Returns False when the game should quit."""
+        if event.type == pygame.QUIT:
+            return False
+        
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                return False
+            elif event.key == pygame.K_SPACE and self.game_won:
+                self.setup_game()
+        
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button == 1:  # Left click
+                self.handle_card_click(event.pos)
+        
+        elif event.type in self.EXPOSE_EVENTS:
+            # Window contents were lost, e.g. after being uncovered
+            self._needs_redraw = True
         
         return True
     
@@ -399,18 +641,47 @@ class MemoryGame:
         running = True
         
         while running:
-            dt = self.clock.tick(60) / 1000.0  # Delta time in seconds
+            if self._animating or self.showing_mismatch:
+                # Something is moving: run at a steady 60 FPS
+                dt = self.clock.tick(60) / 1000.0  # Delta time in seconds
+                running = self.handle_events()
+            else:
+                # Board is static: sleep until input arrives. The timeout keeps
+                # the on-screen timer refreshing while a game is in progress.
+                event = pygame.event.wait(100)
+                self.clock.tick()  # Don't count the idle wait as animation time
+                dt = 0.0
+                running = self.handle_event(event)
             
-            running = self.handle_events()
             self.update(dt)
-            self.draw()
+            self.draw()  # Does nothing while the board is static
         
         pygame.quit()
         sys.exit()
 
 
+def build_atlas():
+    """Combine the card images into the single sprite sheet loaded by the game."""
+    tile_size = MemoryGame.CARD_SIZE - 10
+    atlas = pygame.Surface((tile_size * len(MemoryGame.IMAGE_FILES), tile_size), pygame.SRCALPHA)
+    
+    for i, filename in enumerate(MemoryGame.IMAGE_FILES):
+        image = pygame.image.load(os.path.join(MemoryGame.IMAGE_DIR, filename))
+        # Scale to fit card size with some padding
+        image = pygame.transform.scale(image, (tile_size, tile_size))
+        atlas.blit(image, (i * tile_size, 0))
+    
+    atlas_path = os.path.join(MemoryGame.IMAGE_DIR, MemoryGame.ATLAS_FILE)
+    pygame.image.save(atlas, atlas_path)
+    print(f"Saved image atlas: {atlas_path}")
+
+
 def main():
     """Main function to start the game."""
+    if "--build-atlas" in sys.argv:
+        build_atlas()
+        return
+    
     game = MemoryGame()
     game.run()
 